@@ -3,6 +3,95 @@ import soccerdata as sd
 import pandas as pd
 from datetime import datetime
 
+# Styles for the fixture list, sent once per page instead of inline on every row
+MATCH_LIST_CSS = """
+<style>
+.match-row { display: flex; align-items: center; justify-content: center; gap: 18px; margin-bottom: 10px; }
+.match-date { font-weight: 600; font-size: 15px; }
+.match-team { font-weight: 500; font-size: 15px; }
+.match-score { font-size: 18px; font-weight: bold; }
+.match-xg { font-size: 13px; color: #888; }
+</style>
+"""
+
+# HTML for a single fixture row, filled per match with str.format_map
+MATCH_ROW_TEMPLATE = """
+<div class='match-row'>
+    <span class='match-date'>{date_str}</span>
+    <span class='match-team'>{home_team} ({home_team_code})</span>
+    <span class='match-score'>{score}</span>
+    <span class='match-team'>{away_team} ({away_team_code})</span>
+    <span class='match-xg'>xG: {xg}</span>
+</div>
+"""
+MATCH_ROW_COLUMNS = ["date_str", "home_team", "home_team_code", "score", "away_team", "away_team_code", "xg"]
+
+# Map season string to Understat format
+SEASON_MAP = {"2024/25": "2425", "2025/26": "2526"}
+
+
+def get_available_seasons():
+    """Return the selectable seasons, adding the new one from August."""
+    seasons = ["2024/25"]
+    if datetime.now().month >= 8:
+        seasons.append("2025/26")
+    return seasons
+
+
+def season_finished(understat_season):
+    """Return True once an Understat season such as "2425" has ended."""
+    end_year = 2000 + int(understat_season[2:])
+    return datetime.now() >= datetime(end_year, 7, 1)
+
+
+def get_cache_version(understat_season):
+    """Return the key a season's cached data is stored under."""
+    # Finished seasons never change, so they keep one key; the current season rolls hourly
+    if season_finished(understat_season):
+        return "final"
+    return datetime.now().strftime("%Y-%m-%d %H")
+
+
+# One Understat reader per season, shared across reruns and users; it holds a
+# non-serializable scraper session, so it is a resource rather than cached data
+@st.cache_resource
+def get_understat(understat_season):
+    return sd.Understat(leagues="ENG-Premier League", seasons=understat_season)
+
+
+@st.cache_data(max_entries=8)
+def load_team_match_stats(understat_season, cache_version):
+    """Load Understat EPL team match stats for a season, newest first."""
+    understat = get_understat(understat_season)
+    team_match_stats = understat.read_team_match_stats()
+
+    # Sort by date desc
+    team_match_stats = team_match_stats.sort_values("date", ascending=False)
+
+    # Parse and format kickoff dates once for the whole column
+    team_match_stats["date"] = pd.to_datetime(team_match_stats["date"])
+    team_match_stats["date_str"] = team_match_stats["date"].dt.strftime("%a %d %b %Y %H:%M")
+
+    # Build the score and xG display strings column-wise as well
+    team_match_stats["score"] = (
+        team_match_stats["home_goals"].astype(str) + " - " + team_match_stats["away_goals"].astype(str)
+    )
+    team_match_stats["xg"] = (
+        team_match_stats["home_xg"].map("{:.2f}".format) + " - " + team_match_stats["away_xg"].map("{:.2f}".format)
+    )
+    return team_match_stats
+
+
+@st.cache_data(max_entries=8)
+def render_matches_html(understat_season, cache_version):
+    """Build the fixture list HTML for a season from the cached match stats."""
+    team_match_stats = load_team_match_stats(understat_season, cache_version)
+    return MATCH_LIST_CSS + "".join(
+        MATCH_ROW_TEMPLATE.format_map(match)
+        for match in team_match_stats[MATCH_ROW_COLUMNS].to_dict("records")
+    )
+
+
 # Page config
 st.set_page_config(
     page_title="Premier League Fixtures (Understat)",
@@ -13,40 +102,24 @@ st.set_page_config(
 st.title("⚽ Premier League Matches (Understat)")
 
 # Select season
-current_year = datetime.now().year
-current_month = datetime.now().month
-seasons = ["2024/25"]
-if current_month >= 8:
-    seasons.append("2025/26")
-selected_season = st.selectbox("Select Season:", options=seasons, index=0)
+selected_season = st.selectbox("Select Season:", options=get_available_seasons(), index=0)
+understat_season = SEASON_MAP[selected_season]
+cache_version = get_cache_version(understat_season)
 
-# Map season string to Understat format
-season_map = {"2024/25": "2425", "2025/26": "2526"}
-understat_season = season_map[selected_season]
-
-# Load Understat EPL data
-understat = sd.Understat(leagues="ENG-Premier League", seasons=understat_season)
-team_match_stats = understat.read_team_match_stats()
-
-# Sort by date desc
-team_match_stats = team_match_stats.sort_values("date", ascending=False)
-
-# Display matches
-for idx, row in team_match_stats.iterrows():
-    home = row["home_team"]
-    away = row["away_team"]
-    home_code = row["home_team_code"]
-    away_code = row["away_team_code"]
-    date_str = pd.to_datetime(row["date"]).strftime("%a %d %b %Y %H:%M")
-    score = f"{row['home_goals']} - {row['away_goals']}"
-    home_xg = row["home_xg"]
-    away_xg = row["away_xg"]
-    st.markdown(f"""
-    <div style='display: flex; align-items: center; justify-content: center; gap: 18px; margin-bottom: 10px;'>
-        <span style='font-weight: 600; font-size: 15px;'>{date_str}</span>
-        <span style='font-weight: 500; font-size: 15px;'>{home} ({home_code})</span>
-        <span style='font-size: 18px; font-weight: bold;'>{score}</span>
-        <span style='font-weight: 500; font-size: 15px;'>{away} ({away_code})</span>
-        <span style='font-size: 13px; color: #888;'>xG: {home_xg:.2f} - {away_xg:.2f}</span>
-    </div>
-    """, unsafe_allow_html=True)
+# Display matches, either as a virtualized table or as one markdown element
+if st.toggle("Table view"):
+    team_match_stats = load_team_match_stats(understat_season, cache_version)
+    st.dataframe(
+        team_match_stats[["date", "home_team", "score", "away_team", "home_xg", "away_xg"]],
+        hide_index=True,
+        column_config={
+            "date": st.column_config.DatetimeColumn("Date", format="ddd DD MMM YYYY HH:mm"),
+            "home_team": "Home",
+            "score": "Score",
+            "away_team": "Away",
+            "home_xg": st.column_config.NumberColumn("Home xG", format="%.2f"),
+            "away_xg": st.column_config.NumberColumn("Away xG", format="%.2f"),
+        },
+    )
+else:
+    st.markdown(render_matches_html(understat_season, cache_version), unsafe_allow_html=True)